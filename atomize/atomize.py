@@ -3,16 +3,37 @@
 """ atomize - A simple Python package for easily generating Atom feeds. """
 
 import sys
+import copy
+import codecs
 import datetime
 import mimetypes
+from xml.sax.saxutils import escape, quoteattr
 try:
-    import xml.etree.cElementTree as ET
+    from sys import intern
 except ImportError:
-    import xml.etree.ElementTree as ET
+    pass  # Python 2 has intern as a builtin
 try:
-    import cStringIO as StringIO
+    STRING_TYPES = (str, unicode)
+except NameError:
+    STRING_TYPES = (str,)
+try:
+    from lxml import etree as ET
 except ImportError:
-    import StringIO
+    if sys.version_info[0] < 3:
+        try:
+            import xml.etree.cElementTree as ET
+        except ImportError:
+            import xml.etree.ElementTree as ET
+    else:
+        # cElementTree is only a deprecated alias on Python 3; ElementTree
+        # itself switches to the _elementtree C accelerator when it can
+        import xml.etree.ElementTree as ET
+    # Without the accelerator ElementTree's Element is its Python fallback
+    # (_Element_Py on Python 3, the only Element on Python 2)
+    if (ET.__name__ == "xml.etree.ElementTree" and
+            ET.Element is getattr(ET, "_Element_Py", ET.Element)):
+        sys.stderr.write("Warning: C ElementTree accelerator not " +
+                         "available, falling back to pure Python\n")
 
 __package_name__ = "atomize"
 __version__ = (0, 1, 2)
@@ -22,7 +43,12 @@ __all__ = ["Feed", "Entry", "AtomError", "Author", "Category", "Content",
            "Published", "Rights", "Source", "Subtitle", "Summary", "Title",
            "Updated"]
 
-MIME_TYPES = set(mimetypes.types_map.itervalues())
+MIME_TYPES = set(mimetypes.types_map.values())
+ATOM_NAMESPACE = intern("http://www.w3.org/2005/Atom")
+ATOM_MIME_TYPE = intern("application/atom+xml")
+XHTML_NAMESPACE = intern("http://www.w3.org/1999/xhtml")
+FEED_START_TAG = intern('<feed xmlns="%s">' % ATOM_NAMESPACE)
+XHTML_START_TAG = intern('<div xmlns="%s">' % XHTML_NAMESPACE)
 
 class Feed(object):
 
@@ -30,8 +56,12 @@ class Feed(object):
 
     An implementation of Atom Syndication Format v1.0 """
 
+    __slots__ = ("title", "authors", "updated", "id", "self_link",
+                 "generator", "categories", "contributors", "links", "icon",
+                 "logo", "rights", "subtitle", "entries", "_misc")
+
     def __init__(self, title=None, updated=None, guid=None, author=None,
-                 self_link=None, entries=[], **other_elts):
+                 self_link=None, entries=None, **other_elts):
 
         """ Creates an Atom feed
 
@@ -76,105 +106,164 @@ class Feed(object):
         if title is None or updated is None or guid is None:
             raise AtomError("Feed: title, updated, and guid must be defined")
 
-        self.elements = other_elts
-
-        if isinstance(title, basestring):
-            self.elements["title"] = Title(title)
-        elif isinstance(title, Title):
-            self.elements["title"] = title
-        else:
+        if entries is None:
+            entries = []
+
+        self.authors = other_elts.pop("authors", [])
+        self.id = other_elts.pop("id", None)
+        self.self_link = None
+        # The feed always declares atomize as its generator
+        other_elts.pop("generator", None)
+        self.categories = other_elts.pop("categories", [])
+        self.contributors = other_elts.pop("contributors", [])
+        self.links = other_elts.pop("links", [])
+        self.icon = other_elts.pop("icon", None)
+        self.logo = other_elts.pop("logo", None)
+        self.rights = other_elts.pop("rights", None)
+        self.subtitle = other_elts.pop("subtitle", None)
+        self._misc = other_elts
+
+        self.title = _convert(title, _TITLE_CONVERTERS)
+        if self.title is None:
             raise AtomError("Feed: title must be a string or a Title object")
 
-        if isinstance(author, basestring):
-            self.elements["authors"] = [Author(author)]
-        elif isinstance(author, Author):
-            self.elements["authors"] = [author]
-        elif isinstance(author, list):
-            self.elements["authors"] = author
-        elif author is None:
-            if len(entries) == 0:
+        if author is None:
+            if not entries:
                 raise AtomError("Feed: not entries defined and " +
                                 "no authors are defined for feed")
-            for entry in entries:
-                if "authors" not in entry.elements:
-                    raise AtomError("Feed: not all entries have an author, " +
-                                    "but no authors are defined for feed")
+            if any(not entry.authors for entry in entries):
+                raise AtomError("Feed: not all entries have an author, " +
+                                "but no authors are defined for feed")
         else:
-            raise AtomError("Feed: author must be a string, list or an " +
-                            "Author object")
+            self.authors = _convert(author, _AUTHOR_CONVERTERS)
+            if self.authors is None:
+                raise AtomError("Feed: author must be a string, list or an " +
+                                "Author object")
 
-        if isinstance(updated, datetime.datetime):
-            self.elements["updated"] = Updated(updated)
-        elif isinstance(updated, Updated):
-            self.elements["updated"] = updated
-        else:
+        self.updated = _convert(updated, _UPDATED_CONVERTERS)
+        if self.updated is None:
             raise AtomError("Feed: updated must be a datetime or an Updated " +
                             "object")
 
-        if isinstance(self_link, basestring):
-            self.elements["self_link"] = Link(self_link, rel="self",
-                                              content_type="application/atom+xml")
-        elif isinstance(self_link, Link) and self_link.rel == "self":
-            self.elements["self_link"] = self_link
-        elif self_link is None:
+        if self_link is None:
             sys.stderr.write("Warning: Feed defined without a self_link\n")
         else:
-            raise AtomError("Feed: self_link must be a string or a Link " +
-                            "object with a rel attribute of 'self'")
+            self.self_link = _convert(self_link, _SELF_LINK_CONVERTERS)
+            if self.self_link is None or self.self_link.rel != "self":
+                raise AtomError("Feed: self_link must be a string or a Link " +
+                                "object with a rel attribute of 'self'")
 
-        if isinstance(guid, basestring):
-            self.elements["id"] = ID(guid)
-        elif isinstance(guid, ID):
-            self.elements["id"] = guid
-        else:
+        self.id = _convert(guid, _ID_CONVERTERS)
+        if self.id is None:
             raise AtomError("Feed: guid must be a string or an ID object")
 
-        self.elements["generator"] = Generator(__package_name__,
-                                               version="%s.%s.%s" %
-                                               __version__)
+        self.generator = Generator(__package_name__,
+                                   version="%s.%s.%s" % __version__)
 
         self.entries = entries
 
+    def _children(self):
+
+        """ Yields the feed's child elements in document order """
+
+        yield self.id
+        yield self.title
+        if self.subtitle is not None:
+            yield self.subtitle
+        yield self.updated
+        for elt in self.authors:
+            yield elt
+        for elt in self.contributors:
+            yield elt
+        for elt in self.categories:
+            yield elt
+        if self.self_link is not None:
+            yield self.self_link
+        for elt in self.links:
+            yield elt
+        yield self.generator
+        if self.icon is not None:
+            yield self.icon
+        if self.logo is not None:
+            yield self.logo
+        if self.rights is not None:
+            yield self.rights
+        for value in self._misc.values():
+            if type(value) is list:
+                for elt in value:
+                    yield elt
+            else:
+                yield value
+
     def publish(self):
 
         """ Build the XML Element Tree for the feed """
 
         feed = ET.Element("feed")
-        feed.attrib["xmlns"] = "http://www.w3.org/2005/Atom"
-        for value in self.elements.itervalues():
-            try:
-                for elt in value:
-                    elt.publish(feed)
-            except TypeError:
-                value.publish(feed)
+        feed.attrib["xmlns"] = ATOM_NAMESPACE
+        for elt in self._children():
+            elt.publish(feed)
 
         for entry in self.entries:
             entry.publish(feed)
 
         return ET.ElementTree(feed)
 
-    def _write_to_file(self, file_object, encoding):
+    def _to_xml(self):
+
+        """ Serializes the feed straight to an XML string """
+
+        chunks = [FEED_START_TAG]
+        append = chunks.append
+        for elt in self._children():
+            append(elt._to_xml())
+
+        for entry in self.entries:
+            append(entry._to_xml())
+
+        append("</feed>")
+        return "".join(chunks)
 
-        """ Writes the tree into the given file object """
+    def _serialize(self, encoding):
 
-        self.publish().write(file_object, xml_declaration=True,
-                              encoding=encoding)
+        """ Returns the encoded XML document for the feed """
+
+        document = "<?xml version='1.0' encoding='%s'?>\n%s" % (encoding,
+                                                                self._to_xml())
+        return document.encode(encoding, "xmlcharrefreplace")
+
+    def stream_to(self, file_object, encoding="utf-8"):
+
+        """ Writes the Atom feed to the given binary file object.
+
+        Each entry is serialized and written as it is reached, so the
+        document as a whole is never held in memory. """
+
+        encoder = codecs.getincrementalencoder(encoding)("xmlcharrefreplace")
+        write = file_object.write
+        write(encoder.encode("<?xml version='1.0' encoding='%s'?>\n" %
+                             encoding))
+        write(encoder.encode(FEED_START_TAG))
+        for elt in self._children():
+            write(encoder.encode(elt._to_xml()))
+        for entry in self.entries:
+            write(encoder.encode(entry._to_xml()))
+        write(encoder.encode("</feed>", True))
 
     def write_file(self, filename, encoding="utf-8"):
 
         """ Writes the Atom feed to the filename given """
 
-        out = open(filename, "w")
-        self._write_to_file(out, encoding)
-        out.close()
+        # stream_to writes once per entry; a large buffer batches those
+        # small writes into few syscalls
+        with open(filename, "wb", 1 << 20) as out:
+            self.stream_to(out, encoding)
 
     def feed_string(self, encoding="utf-8"):
 
         """ Returns a string of the Atom feed """
 
-        feed_string = StringIO.StringIO()
-        self._write_to_file(feed_string, encoding)
-        return feed_string.getvalue()
+        return self._serialize(encoding)
 
 
 class AtomPerson(object):
@@ -183,6 +272,8 @@ class AtomPerson(object):
 
     Allows storing the name, and optionally a uri and email address """
 
+    __slots__ = ("name", "uri", "email")
+
     def __init__(self, name, uri=None, email=None):
 
         """ A person entity for an Atom feed.
@@ -193,16 +284,12 @@ class AtomPerson(object):
         self.name = name
         self.uri = uri
         self.email = email
-        if uri:
-            self.uri = uri
-        if email:
-            self.email = email
 
     def publish(self, parent):
 
         """ Used in building the Atom Feed's XML tree """
 
-        elt = ET.SubElement(parent, self.__class__.__name__.lower())
+        elt = ET.SubElement(parent, self._tag)
         name = ET.SubElement(elt, "name")
         name.text = self.name
         if self.uri:
@@ -212,25 +299,42 @@ class AtomPerson(object):
             email = ET.SubElement(elt, "email")
             email.text = self.email
 
+    def _to_xml(self):
+
+        """ Serializes the person straight to an XML string """
+
+        tag = self._tag
+        chunks = ["<%s><name>%s</name>" % (tag, _escape_text(self.name))]
+        if self.uri:
+            chunks.append("<uri>%s</uri>" % escape(self.uri))
+        if self.email:
+            chunks.append("<email>%s</email>" % escape(self.email))
+        chunks.append("</%s>" % tag)
+        return "".join(chunks)
+
 
 class Author(AtomPerson):
 
     """ Information about the author of a feed or entry """
 
-    pass
+    __slots__ = ()
+    _tag = "author"
 
 
 class Contributor(AtomPerson):
 
     """ Defines a person who contributed to a feed or entry """
 
-    pass
+    __slots__ = ()
+    _tag = "contributor"
 
 
 class AtomText(object):
 
     """ A text object for an entry or feed """
 
+    __slots__ = ("content_type", "content", "_div")
+
     def __init__(self, content, content_type="text"):
 
         """ Initializes the text object.
@@ -244,7 +348,13 @@ class AtomText(object):
         if content_type == "text" or content_type == "html":
             self.content = content
         elif content_type == "xhtml":
-            self.content = '<div>%s</div>' % content
+            # Keep xhtml as text so it joins cleanly with the rest of the
+            # serialized feed
+            if isinstance(content, bytes):
+                content = content.decode("utf-8")
+            self.content = u'<div>%s</div>' % content
+            self._div = ET.fromstring(self.content.encode("utf-8"))
+            self._div.attrib["xmlns"] = XHTML_NAMESPACE
         else:
             raise AtomError("%s: content_type must be 'text', 'html' or " +
                             "'xhtml'" % self.__class__.__name__)
@@ -253,32 +363,40 @@ class AtomText(object):
 
         """ Used in building the Atom feed's Element Tree """
 
-        elt = ET.SubElement(parent, self.__class__.__name__.lower())
+        elt = ET.SubElement(parent, self._tag)
         elt.attrib["type"] = self.content_type
         if self.content_type == "xhtml":
-            content_string = StringIO.StringIO()
-            content_string.write(self.content)
-            content_string.seek(0)
-            tree = ET.parse(content_string)
-            div = tree.getroot()
-            div.attrib["xmlns"] = "http://www.w3.org/1999/xhtml"
-            elt.append(div)
+            elt.append(copy.deepcopy(self._div))
         else:
             elt.text = self.content
 
+    def _to_xml(self):
+
+        """ Serializes the text straight to an XML string """
+
+        tag = self._tag
+        if self.content_type == "xhtml":
+            content = self.content.replace("<div>", XHTML_START_TAG, 1)
+        else:
+            content = _escape_text(self.content)
+        return '<%s type=%s>%s</%s>' % (tag, quoteattr(self.content_type),
+                                        content, tag)
+
 
 class Rights(AtomText):
 
     """ Place for a copyright definition """
 
-    pass
+    __slots__ = ()
+    _tag = "rights"
 
 
 class Subtitle(AtomText):
 
     """ A subtitle for a feed """
 
-    pass
+    __slots__ = ()
+    _tag = "subtitle"
 
 
 class Summary(AtomText):
@@ -287,20 +405,24 @@ class Summary(AtomText):
 
     Should not duplicate a Content object """
 
-    pass
+    __slots__ = ()
+    _tag = "summary"
 
 
 class Title(AtomText):
 
     """ The title of the feed or an entry """
 
-    pass
+    __slots__ = ()
+    _tag = "title"
 
 
 class Content(object):
 
     """ Contains the content of the entry """
 
+    __slots__ = ("content", "type", "src", "_div")
+
     def __init__(self, content=None, content_type="text", src=None):
 
         """ Intializes the Content object.
@@ -312,7 +434,11 @@ class Content(object):
                 raise AtomError("Content: Must have content defined if the type " +
                                 "is xhtml, html, or text")
             if content_type == "xhtml":
-                content = '<div>%s</div>' % content
+                if isinstance(content, bytes):
+                    content = content.decode("utf-8")
+                content = u'<div>%s</div>' % content
+                self._div = ET.fromstring(content.encode("utf-8"))
+                self._div.attrib["xmlns"] = XHTML_NAMESPACE
             self.content = content
         elif content_type in MIME_TYPES:
             self.content = content
@@ -332,13 +458,7 @@ class Content(object):
 
         elt = ET.SubElement(parent, "content")
         if self.content and self.type == "xhtml":
-            content_string = StringIO.StringIO()
-            content_string.write(self.content)
-            content_string.seek(0)
-            div_tree = ET.parse(content_string)
-            div = div_tree.getroot()
-            div.attrib["xmlns"] = "http://www.w3.org/1999/xhtml"
-            elt.append(div)
+            elt.append(copy.deepcopy(self._div))
         elif self.content:
             elt.text = self.content
         if self.type:
@@ -346,45 +466,78 @@ class Content(object):
         if self.src:
             elt.attrib["src"] = self.src
 
+    def _to_xml(self):
+
+        """ Serializes the content straight to an XML string """
+
+        attrs = ""
+        if self.type:
+            attrs += " type=%s" % quoteattr(self.type)
+        if self.src:
+            attrs += " src=%s" % quoteattr(self.src)
+        if self.content and self.type == "xhtml":
+            content = self.content.replace("<div>", XHTML_START_TAG, 1)
+        elif self.content:
+            content = escape(self.content)
+        else:
+            return "<content%s />" % attrs
+        return "<content%s>%s</content>" % (attrs, content)
+
 
 class AtomDate(object):
 
     """ A date object for an entry or feed """
 
+    __slots__ = ("date",)
+
     def __init__(self, date):
 
         """ Initializes date object.
 
         The date parameter must be a datetime. It is assumed to be in UTC. """
 
-        self.date = date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        self.date = "%04d-%02d-%02dT%02d:%02d:%02dZ" % (date.year, date.month,
+                                                        date.day, date.hour,
+                                                        date.minute,
+                                                        date.second)
 
     def publish(self, parent):
 
         " Used in building the Atom feed's XML Element Tree """
 
-        elt = ET.SubElement(parent, self.__class__.__name__.lower())
+        elt = ET.SubElement(parent, self._tag)
         elt.text = self.date
 
+    def _to_xml(self):
+
+        """ Serializes the date straight to an XML string """
+
+        tag = self._tag
+        return "<%s>%s</%s>" % (tag, self.date, tag)
+
 
 class Updated(AtomDate):
 
     """ Encode information about when the entry or feed was last updated """
 
-    pass
+    __slots__ = ()
+    _tag = "updated"
 
 
 class Published(AtomDate):
 
     """ Encode information about when the entry was originally published """
 
-    pass
+    __slots__ = ()
+    _tag = "published"
 
 
 class AtomURI(object):
 
     """ A URI object for an entry or feed """
 
+    __slots__ = ("uri",)
+
     def __init__(self, uri):
 
         """ Initializes the URI object
@@ -397,35 +550,67 @@ class AtomURI(object):
 
         """ Used in building the Atom feed's XML element tree """
 
-        elt = ET.SubElement(parent, self.__class__.__name__.lower())
+        elt = ET.SubElement(parent, self._tag)
         elt.text = self.uri
 
+    def _to_xml(self):
+
+        """ Serializes the URI straight to an XML string """
+
+        tag = self._tag
+        return "<%s>%s</%s>" % (tag, _escape_text(self.uri), tag)
+
 
 class Icon(AtomURI):
 
     """ Allows a favicon to be defined for the Feed or Source """
 
-    pass
+    __slots__ = ()
+    _tag = "icon"
 
 
 class ID(AtomURI):
 
     """ A unique identifier for a feed or entry """
 
-    pass
+    __slots__ = ()
+    _tag = "id"
 
 
 class Logo(AtomURI):
 
     """ Permits the definition of a logo for a feed """
 
-    pass
+    __slots__ = ()
+    _tag = "logo"
+
+
+class CachedElement(object):
+
+    """ Base for leaf elements that cache their serialized form.
+
+    publish() caches the attribute dict and _to_xml() the XML string on
+    first use. Setting any public attribute clears both caches, so a
+    changed element is serialized afresh the next time it is used. """
 
+    __slots__ = ("_cached_attrib", "_cached_xml")
 
-class Generator(object):
+    def __setattr__(self, name, value):
+
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            # This also creates the caches when __init__ sets the
+            # first attribute
+            object.__setattr__(self, "_cached_attrib", None)
+            object.__setattr__(self, "_cached_xml", None)
+
+
+class Generator(CachedElement):
 
     """ Information about what generated the Atom feed """
 
+    __slots__ = ("name", "version", "uri")
+
     def __init__(self, name, version=None, uri=None):
 
         self.name = name
@@ -436,18 +621,37 @@ class Generator(object):
 
         """ Used in building the Atom feed's XML Element Tree """
 
-        elt = ET.SubElement(parent, "generator")
+        if self._cached_attrib is None:
+            attrib = {}
+            if self.version:
+                attrib["version"] = self.version
+            if self.uri:
+                attrib["uri"] = self.uri
+            self._cached_attrib = attrib
+        elt = ET.SubElement(parent, "generator", self._cached_attrib)
         elt.text = self.name
-        if self.version:
-            elt.attrib["version"] = self.version
-        if self.uri:
-            elt.attrib["uri"] = self.uri
 
+    def _to_xml(self):
+
+        """ Serializes the generator straight to an XML string """
+
+        if self._cached_xml is None:
+            attrs = ""
+            if self.version:
+                attrs += " version=%s" % quoteattr(self.version)
+            if self.uri:
+                attrs += " uri=%s" % quoteattr(self.uri)
+            self._cached_xml = "<generator%s>%s</generator>" % (
+                attrs, _escape_text(self.name))
+        return self._cached_xml
 
-class Category(object):
+
+class Category(CachedElement):
 
     """ Information about the category of a feed or entry """
 
+    __slots__ = ("term", "scheme", "label")
+
     def __init__(self, term, scheme=None, label=None):
 
         self.term = term
@@ -458,18 +662,36 @@ class Category(object):
 
         """ Used in building the Atom feed's XML Element Tree """
 
-        elt = ET.SubElement(parent, "category")
-        elt.attrib["term"] = self.term
-        if self.scheme:
-            elt.attrib["scheme"] = self.scheme
-        if self.label:
-            elt.attrib["label"] = self.label
+        if self._cached_attrib is None:
+            attrib = {"term": self.term}
+            if self.scheme:
+                attrib["scheme"] = self.scheme
+            if self.label:
+                attrib["label"] = self.label
+            self._cached_attrib = attrib
+        ET.SubElement(parent, "category", self._cached_attrib)
+
+    def _to_xml(self):
 
+        """ Serializes the category straight to an XML string """
 
-class Link(object):
+        if self._cached_xml is None:
+            attrs = " term=%s" % quoteattr(self.term)
+            if self.scheme:
+                attrs += " scheme=%s" % quoteattr(self.scheme)
+            if self.label:
+                attrs += " label=%s" % quoteattr(self.label)
+            self._cached_xml = "<category%s />" % attrs
+        return self._cached_xml
+
+
+class Link(CachedElement):
 
     """ A link for in the Atom feed """
 
+    __slots__ = ("href", "rel", "content_type", "hreflang", "title",
+                 "length")
+
     def __init__(self, href, rel=None, content_type=None, hreflang=None,
                  title=None, length=None):
         self.href = href
@@ -483,24 +705,49 @@ class Link(object):
 
         """ Used in building the Atom feed's XML Element Tree """
 
-        elt = ET.SubElement(parent, "link")
-        elt.attrib["href"] = self.href
-        if self.rel:
-            elt.attrib["rel"] = self.rel
-        if self.content_type:
-            elt.attrib["type"] = self.content_type
-        if self.hreflang:
-            elt.attrib["hreflang"] = self.hreflang
-        if self.title:
-            elt.attrib["title"] = self.title
-        if self.length:
-            elt.attrib["length"] = self.length
+        if self._cached_attrib is None:
+            attrib = {"href": self.href}
+            if self.rel:
+                attrib["rel"] = self.rel
+            if self.content_type:
+                attrib["type"] = self.content_type
+            if self.hreflang:
+                attrib["hreflang"] = self.hreflang
+            if self.title:
+                attrib["title"] = self.title
+            if self.length:
+                attrib["length"] = self.length
+            self._cached_attrib = attrib
+        ET.SubElement(parent, "link", self._cached_attrib)
+
+    def _to_xml(self):
+
+        """ Serializes the link straight to an XML string """
+
+        if self._cached_xml is None:
+            attrs = " href=%s" % quoteattr(self.href)
+            if self.rel:
+                attrs += " rel=%s" % quoteattr(self.rel)
+            if self.content_type:
+                attrs += " type=%s" % quoteattr(self.content_type)
+            if self.hreflang:
+                attrs += " hreflang=%s" % quoteattr(self.hreflang)
+            if self.title:
+                attrs += " title=%s" % quoteattr(self.title)
+            if self.length:
+                attrs += " length=%s" % quoteattr(self.length)
+            self._cached_xml = "<link%s />" % attrs
+        return self._cached_xml
 
 
 class Entry(object):
 
     """ Defines an Atom entry (ie an article, post, etc) """
 
+    __slots__ = ("title", "authors", "updated", "id", "categories",
+                 "contributors", "links", "content", "published", "source",
+                 "rights", "summary", "_misc")
+
     def __init__(self, title=None, guid=None, updated=None, author=None,
                  **other_elts):
 
@@ -546,57 +793,97 @@ class Entry(object):
         if title is None or guid is None or updated is None:
             raise AtomError("Entry: title, guid, and updated must be defined")
 
-        self.elements = other_elts
-
-        if isinstance(title, basestring):
-            self.elements["title"] = Title(title)
-        elif isinstance(title, Title):
-            self.elements["title"] = title
-        else:
+        self.authors = other_elts.pop("authors", [])
+        self.id = other_elts.pop("id", None)
+        self.categories = other_elts.pop("categories", [])
+        self.contributors = other_elts.pop("contributors", [])
+        self.links = other_elts.pop("links", [])
+        self.content = other_elts.pop("content", None)
+        self.published = other_elts.pop("published", None)
+        self.source = other_elts.pop("source", None)
+        self.rights = other_elts.pop("rights", None)
+        self.summary = other_elts.pop("summary", None)
+        self._misc = other_elts
+
+        self.title = _convert(title, _TITLE_CONVERTERS)
+        if self.title is None:
             raise AtomError("Entry: title must be a string or a Title object")
 
-        if isinstance(author, basestring):
-            self.elements["authors"] = [Author(author)]
-        elif isinstance(author, Author):
-            self.elements["authors"] = [author]
-        elif isinstance(author, list):
-            self.elements["authors"] = author
-        elif author is not None:
-            raise AtomError("Entry: author must be a string, list or an " +
-                            "Author object")
-
-        if isinstance(updated, datetime.datetime):
-            self.elements["updated"] = Updated(updated)
-        elif isinstance(updated, Updated):
-            self.elements["updated"] = updated
-        else:
+        if author is not None:
+            self.authors = _convert(author, _AUTHOR_CONVERTERS)
+            if self.authors is None:
+                raise AtomError("Entry: author must be a string, list or an " +
+                                "Author object")
+
+        self.updated = _convert(updated, _UPDATED_CONVERTERS)
+        if self.updated is None:
             raise AtomError("Entry: updated must be a datetime or an " +
                             "Updated object")
 
-        if isinstance(guid, basestring):
-            self.elements["id"] = ID(guid)
-        elif isinstance(guid, ID):
-            self.elements["id"] = guid
-        else:
+        self.id = _convert(guid, _ID_CONVERTERS)
+        if self.id is None:
             raise AtomError("Entry: guid must be a string or an ID object")
 
+    def _children(self):
+
+        """ Yields the entry's child elements in document order """
+
+        yield self.id
+        yield self.title
+        yield self.updated
+        if self.published is not None:
+            yield self.published
+        for elt in self.authors:
+            yield elt
+        for elt in self.contributors:
+            yield elt
+        for elt in self.categories:
+            yield elt
+        for elt in self.links:
+            yield elt
+        if self.source is not None:
+            yield self.source
+        if self.rights is not None:
+            yield self.rights
+        if self.summary is not None:
+            yield self.summary
+        if self.content is not None:
+            yield self.content
+        for value in self._misc.values():
+            if type(value) is list:
+                for elt in value:
+                    yield elt
+            else:
+                yield value
+
     def publish(self, parent):
 
         """ Used in building the Atom feed's XML Element Tree """
 
         entry = ET.SubElement(parent, "entry")
-        for value in self.elements.itervalues():
-            try:
-                for elt in value:
-                    elt.publish(entry)
-            except TypeError:
-                value.publish(entry)
+        for elt in self._children():
+            elt.publish(entry)
+
+    def _to_xml(self):
+
+        """ Serializes the entry straight to an XML string """
+
+        chunks = ["<entry>"]
+        append = chunks.append
+        for elt in self._children():
+            append(elt._to_xml())
+        append("</entry>")
+        return "".join(chunks)
 
 
 class Source(object):
 
     """ Defines an Atom source (ie an article, post, etc) """
 
+    __slots__ = ("title", "authors", "updated", "id", "categories",
+                 "contributors", "links", "generator", "icon", "logo",
+                 "subtitle", "rights", "_misc")
+
     def __init__(self, title=None, guid=None, updated=None, author=None,
                  **other_elts):
 
@@ -635,51 +922,96 @@ class Source(object):
             sys.stdout.write("Warning: it is recommended you define a " +
                              "title, guid, and source for a Source object\n")
 
-        self.elements = other_elts
+        self.title = None
+        self.authors = other_elts.pop("authors", [])
+        self.updated = None
+        self.id = other_elts.pop("id", None)
+        self.categories = other_elts.pop("categories", [])
+        self.contributors = other_elts.pop("contributors", [])
+        self.links = other_elts.pop("links", [])
+        self.generator = other_elts.pop("generator", None)
+        self.icon = other_elts.pop("icon", None)
+        self.logo = other_elts.pop("logo", None)
+        self.subtitle = other_elts.pop("subtitle", None)
+        self.rights = other_elts.pop("rights", None)
+        self._misc = other_elts
+
+        if title is not None:
+            self.title = _convert(title, _TITLE_CONVERTERS)
+            if self.title is None:
+                raise AtomError("Entry: title must be a string or a Title " +
+                                "object")
+
+        if author is not None:
+            self.authors = _convert(author, _AUTHOR_CONVERTERS)
+            if self.authors is None:
+                raise AtomError("Entry: author must be a string, list or an " +
+                                "Author object")
+
+        if updated is not None:
+            self.updated = _convert(updated, _UPDATED_CONVERTERS)
+            if self.updated is None:
+                raise AtomError("Entry: updated must be a datetime or an " +
+                                "Updated object")
+
+        if guid is not None:
+            self.id = _convert(guid, _ID_CONVERTERS)
+            if self.id is None:
+                raise AtomError("Entry: guid must be a string or an ID object")
+
+    def _children(self):
+
+        """ Yields the source's child elements in document order """
+
+        if self.id is not None:
+            yield self.id
+        if self.title is not None:
+            yield self.title
+        if self.subtitle is not None:
+            yield self.subtitle
+        if self.updated is not None:
+            yield self.updated
+        for elt in self.authors:
+            yield elt
+        for elt in self.contributors:
+            yield elt
+        for elt in self.categories:
+            yield elt
+        for elt in self.links:
+            yield elt
+        if self.generator is not None:
+            yield self.generator
+        if self.icon is not None:
+            yield self.icon
+        if self.logo is not None:
+            yield self.logo
+        if self.rights is not None:
+            yield self.rights
+        for value in self._misc.values():
+            if type(value) is list:
+                for elt in value:
+                    yield elt
+            else:
+                yield value
 
-        if isinstance(title, basestring):
-            self.elements["title"] = Title(title)
-        elif isinstance(title, Title):
-            self.elements["title"] = title
-        elif title is not None:
-            raise AtomError("Entry: title must be a string or a Title object")
+    def publish(self, parent):
 
-        if isinstance(author, basestring):
-            self.elements["authors"] = [Author(author)]
-        elif isinstance(author, Author):
-            self.elements["authors"] = [author]
-        elif isinstance(author, list):
-            self.elements["authors"] = author
-        elif author is not None:
-            raise AtomError("Entry: author must be a string, list or an " +
-                            "Author object")
-
-        if isinstance(updated, datetime.datetime):
-            self.elements["updated"] = Updated(updated)
-        elif isinstance(updated, Updated):
-            self.elements["updated"] = updated
-        elif updated is not None:
-            raise AtomError("Entry: updated must be a datetime or an " +
-                            "Updated object")
+        """ Used in building the Atom feed's XML Element Tree """
 
-        if isinstance(guid, basestring):
-            self.elements["id"] = ID(guid)
-        elif isinstance(guid, ID):
-            self.elements["id"] = guid
-        elif id is not None:
-            raise AtomError("Entry: guid must be a string or an ID object")
+        source = ET.SubElement(parent, "source")
+        for elt in self._children():
+            elt.publish(source)
 
-    def publish(self, parent):
+    def _to_xml(self):
 
-        """ Used in building the Atom feed's XML Element Tree """
+        """ Serializes the source straight to an XML string """
 
-        source = ET.SubElement(parent, "entry")
-        for value in self.elements.itervalues():
-            try:
-                for elt in value:
-                    elt.publish(source)
-            except TypeError:
-                value.publish(source)
+        chunks = ["<source>"]
+        append = chunks.append
+        for elt in self._children():
+            append(elt._to_xml())
+        append("</source>")
+        return "".join(chunks)
 
 
 class AtomError(Exception):
@@ -698,3 +1030,53 @@ class AtomError(Exception):
 
     def __repr__(self):
         return str(self)
+
+
+def _escape_text(text):
+
+    """ Escapes element text, treating None as empty like ElementTree """
+
+    if text is None:
+        return ""
+    return escape(text)
+
+
+def _convert(value, converters):
+
+    """ Converts an argument into its Atom element.
+
+    Looks up the converter for the value's exact type first and only falls
+    back to isinstance checks for subclasses. Returns None if no converter
+    accepts the value. """
+
+    converter = converters.get(type(value))
+    if converter is None:
+        for cls, candidate in converters.items():
+            if isinstance(value, cls):
+                converter = candidate
+                break
+        else:
+            return None
+    return converter(value)
+
+
+def _self_link(href):
+
+    """ Builds the feed's self link from a URI string """
+
+    return Link(href, rel="self", content_type=ATOM_MIME_TYPE)
+
+
+_TITLE_CONVERTERS = {Title: lambda title: title}
+_AUTHOR_CONVERTERS = {Author: lambda author: [author],
+                      list: lambda authors: authors}
+_UPDATED_CONVERTERS = {Updated: lambda updated: updated,
+                       datetime.datetime: Updated}
+_SELF_LINK_CONVERTERS = {Link: lambda link: link}
+_ID_CONVERTERS = {ID: lambda guid: guid}
+for string_type in STRING_TYPES:
+    _TITLE_CONVERTERS[string_type] = Title
+    _AUTHOR_CONVERTERS[string_type] = lambda author: [Author(author)]
+    _SELF_LINK_CONVERTERS[string_type] = _self_link
+    _ID_CONVERTERS[string_type] = ID
+del string_type
@@ -1,8 +1,40 @@
 #!/usr/bin/env python
 
 from distutils.core import setup
+from distutils.command.build_ext import build_ext
+from distutils.errors import (CCompilerError, DistutilsExecError,
+                              DistutilsPlatformError)
 import sys
 
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["atomize/atomize.py"],
+                            compiler_directives={"language_level": 2})
+except ImportError:
+    ext_modules = []
+
+
+class optional_build_ext(build_ext):
+
+    """ Builds the compiled module when possible.
+
+    Falls back to the pure-Python module if there is no working C
+    compiler. """
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except DistutilsPlatformError:
+            self.warn("no C compiler found, installing pure-Python atomize")
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except (CCompilerError, DistutilsExecError, DistutilsPlatformError):
+            self.warn("building %s failed, installing pure-Python atomize" %
+                      ext.name)
+
+
 sys.path.insert(0, "atomize")
 import atomize
 
@@ -16,6 +48,8 @@ setup(name="atomize",
       long_description="A pure-Python package for easily generating Atom Syndicated Format feeds.",
       package_dir={"": "atomize"},
       py_modules=["atomize"],
+      ext_modules=ext_modules,
+      cmdclass={"build_ext": optional_build_ext},
       provides=["atomize"],
       keywords="atom web",
       license="Eclipse Public License 1.0")
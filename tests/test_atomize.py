@@ -0,0 +1,286 @@
+""" Tests for atomize """
+
+import io
+import os
+import sys
+import datetime
+import subprocess
+import unittest
+
+ATOMIZE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                           "atomize")
+sys.path.insert(0, ATOMIZE_DIR)
+import atomize
+from atomize import ET
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+CAFE = u"caf\u00e9"
+
+
+def canonical(elt):
+
+    """ Reduces an element tree to comparable tuples """
+
+    return (elt.tag, sorted(elt.attrib.items()), elt.text or "",
+            elt.tail or "", [canonical(child) for child in elt])
+
+
+def build_feed():
+
+    """ A feed touching every kind of element """
+
+    source = atomize.Source(title="src", guid="source-id",
+                            updated=datetime.datetime(2019, 5, 5))
+    entry = atomize.Entry(title="t <1>", guid="entry-1",
+                          updated=datetime.datetime(2020, 1, 2),
+                          author=atomize.Author("me", uri="http://me",
+                                                email="me@example.com"),
+                          content=atomize.Content("<b>x</b> &amp; y",
+                                                  content_type="xhtml"),
+                          summary=atomize.Summary("<p>s & t</p>", "html"),
+                          links=[atomize.Link("http://x", rel="alternate",
+                                              title='a "b"')],
+                          categories=[atomize.Category("c", label="L & M")],
+                          source=source)
+    other = atomize.Entry(title=atomize.Title("<i>x</i>", "xhtml"),
+                          guid="entry-2",
+                          updated=datetime.datetime(2020, 1, 3),
+                          author="someone",
+                          contributors=[atomize.Contributor("c")],
+                          rights=atomize.Rights(None))
+    return atomize.Feed(title="T", updated=datetime.datetime(2020, 1, 1),
+                        guid="feed-id", self_link="http://s",
+                        entries=[entry, other],
+                        subtitle=atomize.Subtitle("<i>s</i>", "xhtml"),
+                        icon=atomize.Icon("http://i"))
+
+
+def build_entry(**other_elts):
+
+    """ An entry with just the required elements plus other_elts """
+
+    return atomize.Entry(title="t", guid="g",
+                         updated=datetime.datetime(2020, 1, 1), **other_elts)
+
+
+def published_tree(feed):
+
+    """ The feed's publish() tree, round-tripped to resolve namespaces """
+
+    return ET.fromstring(ET.tostring(feed.publish().getroot()))
+
+
+class ImportTest(unittest.TestCase):
+
+    def import_stderr(self, blocked):
+
+        """ Imports atomize in a fresh interpreter with modules blocked """
+
+        code = ("import sys\n"
+                "for name in %r:\n"
+                "    sys.modules[name] = None\n"
+                "sys.path.insert(0, %r)\n"
+                "import atomize\n" % (blocked, ATOMIZE_DIR))
+        process = subprocess.Popen([sys.executable, "-c", code],
+                                   stderr=subprocess.PIPE)
+        return process.communicate()[1].decode("utf-8")
+
+    def test_warns_without_c_accelerator(self):
+        stderr = self.import_stderr(["lxml", "_elementtree"])
+        self.assertTrue("C ElementTree accelerator not available" in stderr)
+
+    def test_quiet_with_c_accelerator(self):
+        stderr = self.import_stderr(["lxml"])
+        self.assertFalse("C ElementTree accelerator" in stderr)
+
+
+class SerializationTest(unittest.TestCase):
+
+    def test_feed_string_matches_publish(self):
+        feed = build_feed()
+        self.assertEqual(canonical(ET.fromstring(feed.feed_string())),
+                         canonical(published_tree(feed)))
+
+    def test_write_file_matches_feed_string(self):
+        feed = build_feed()
+        filename = os.path.join(os.path.dirname(__file__), "feed.xml")
+        try:
+            feed.write_file(filename)
+            with open(filename, "rb") as written:
+                self.assertEqual(written.read(), feed.feed_string())
+        finally:
+            os.remove(filename)
+
+    def test_stream_to_multibyte_encoding(self):
+        feed = build_feed()
+        feed.entries[0].title = atomize.Title(CAFE)
+        for encoding in ("utf-16", "utf-8"):
+            out = io.BytesIO()
+            feed.stream_to(out, encoding)
+            document = out.getvalue()
+            self.assertEqual(document, feed.feed_string(encoding))
+            text = document.decode(encoding)
+            self.assertEqual(text.count(u"\ufeff"), 0)
+            self.assertEqual(text.count(CAFE), 1)
+            self.assertEqual(canonical(ET.fromstring(document)),
+                             canonical(published_tree(feed)))
+
+    def test_none_text(self):
+        self.assertEqual(atomize.Title(None)._to_xml(),
+                         '<title type="text"></title>')
+        self.assertEqual(atomize.ID(None)._to_xml(), "<id></id>")
+
+    def test_source_element(self):
+        root = ET.fromstring(build_feed().feed_string())
+        entry = root.find(ATOM + "entry")
+        self.assertEqual(len(entry.findall(ATOM + "source")), 1)
+        self.assertEqual(len(entry.findall(ATOM + "entry")), 0)
+
+    def test_non_ascii_xhtml(self):
+        for body in (u"<p>%s</p>" % CAFE,
+                     (u"<p>%s</p>" % CAFE).encode("utf-8")):
+            entry = atomize.Entry(title=CAFE, guid="g",
+                                  updated=datetime.datetime(2020, 1, 1),
+                                  author="me",
+                                  content=atomize.Content(
+                                      body, content_type="xhtml"))
+            feed = atomize.Feed(title="T", guid="f", self_link="http://s",
+                                updated=datetime.datetime(2020, 1, 1),
+                                entries=[entry])
+            document = feed.feed_string()
+            self.assertEqual(document.decode("utf-8").count(CAFE), 2)
+            self.assertEqual(canonical(ET.fromstring(document)),
+                             canonical(published_tree(feed)))
+
+
+class ElementsTest(unittest.TestCase):
+
+    def test_single_generator(self):
+        feed = atomize.Feed(title="T", guid="f", author="me",
+                            self_link="http://s",
+                            updated=datetime.datetime(2020, 1, 1),
+                            generator=atomize.Generator("mine"))
+        root = ET.fromstring(feed.feed_string())
+        generators = root.findall(ATOM + "generator")
+        self.assertEqual([elt.text for elt in generators], ["atomize"])
+
+    def test_single_id(self):
+        entry = build_entry(id=atomize.ID("x"))
+        root = ET.fromstring(entry._to_xml())
+        self.assertEqual([elt.text for elt in root.iter("id")], ["g"])
+
+        source = atomize.Source(title="s", guid="g",
+                                updated=datetime.datetime(2020, 1, 1),
+                                id=atomize.ID("x"))
+        root = ET.fromstring(source._to_xml())
+        self.assertEqual([elt.text for elt in root.iter("id")], ["g"])
+
+    def test_authors_keyword(self):
+        entry = build_entry(authors=[atomize.Author("me")])
+        self.assertEqual([author.name for author in entry.authors], ["me"])
+        feed = atomize.Feed(title="T", guid="f", self_link="http://s",
+                            updated=datetime.datetime(2020, 1, 1),
+                            entries=[entry])
+        self.assertEqual(feed.entries, [entry])
+
+
+    def test_cache_cleared_on_change(self):
+        link = atomize.Link("http://old", rel="alternate")
+        feed = build_feed()
+        feed.links = [link]
+        feed.entries[0].links = [link]
+        feed.feed_string()
+        feed.publish()
+
+        feed.generator.name = "renamed"
+        link.href = "http://new"
+        for root in (ET.fromstring(feed.feed_string()),
+                     published_tree(feed)):
+            self.assertEqual(root.find(ATOM + "generator").text, "renamed")
+            hrefs = [elt.get("href") for elt in root.iter(ATOM + "link")
+                     if elt.get("rel") == "alternate"]
+            self.assertEqual(hrefs, ["http://new", "http://new"])
+
+
+    def test_no_instance_dict(self):
+        feed = build_feed()
+        elements = [feed, feed.generator, feed.self_link] + feed.entries
+        for entry in feed.entries:
+            elements.extend(entry._children())
+        for elt in elements:
+            self.assertFalse(hasattr(elt, "__dict__"), type(elt).__name__)
+
+
+class FeedTest(unittest.TestCase):
+
+    def minimal_feed(self):
+        return atomize.Feed(title="T", guid="f", author="me",
+                            self_link="http://s",
+                            updated=datetime.datetime(2020, 1, 1))
+
+    def test_entries_default_is_fresh_list(self):
+        first, second = self.minimal_feed(), self.minimal_feed()
+        self.assertEqual(first.entries, [])
+        first.entries.append(build_entry())
+        self.assertEqual(second.entries, [])
+
+    def test_author_required_without_entries(self):
+        self.assertRaises(atomize.AtomError, atomize.Feed, title="T",
+                          guid="f", self_link="http://s",
+                          updated=datetime.datetime(2020, 1, 1))
+
+    def test_author_required_for_every_entry(self):
+        entries = [build_entry(authors=[atomize.Author("me")]), build_entry()]
+        self.assertRaises(atomize.AtomError, atomize.Feed, title="T",
+                          guid="f", self_link="http://s",
+                          updated=datetime.datetime(2020, 1, 1),
+                          entries=entries)
+
+
+class ConvertTest(unittest.TestCase):
+
+    def feed_args(self, **overrides):
+        args = {"title": "T", "guid": "f", "author": "me",
+                "self_link": "http://s",
+                "updated": datetime.datetime(2020, 1, 1)}
+        args.update(overrides)
+        return args
+
+    def test_rejected_arguments(self):
+        for name, value in [("title", 1), ("author", 1), ("updated", "x"),
+                            ("self_link", 1), ("guid", 1),
+                            ("self_link", atomize.Link("http://s"))]:
+            self.assertRaises(atomize.AtomError, atomize.Feed,
+                              **self.feed_args(**{name: value}))
+
+    def test_accepted_arguments(self):
+        authors = [atomize.Author("a"), atomize.Author("b")]
+        feed = atomize.Feed(**self.feed_args(title=CAFE, author=authors))
+        self.assertEqual(feed.title.content, CAFE)
+        self.assertEqual(feed.authors, authors)
+        self.assertEqual(feed.self_link.rel, "self")
+        self.assertEqual(feed.id.uri, "f")
+
+    def test_subclass_arguments(self):
+
+        class Moment(datetime.datetime):
+            pass
+
+        class Headline(atomize.Title):
+            pass
+
+        headline = Headline("h")
+        feed = atomize.Feed(**self.feed_args(
+            title=headline, updated=Moment(2020, 1, 1)))
+        self.assertTrue(feed.title is headline)
+        self.assertTrue(isinstance(feed.updated, atomize.Updated))
+        self.assertEqual(feed.updated.date, "2020-01-01T00:00:00Z")
+
+    def test_source_without_guid(self):
+        source = atomize.Source(title="s")
+        self.assertTrue(source.id is None)
+        self.assertEqual(ET.fromstring(source._to_xml()).find("id"), None)
+
+
+if __name__ == "__main__":
+    unittest.main()